@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+"""Shared output-directory handling for the local scripts."""
+
+import pathlib
+
+# All generated artifacts (genesis files, IMF cache) live here
+GENERATED = pathlib.Path("generated")
+
+_ready = False
+
+
+def ensure_generated_dir():
+    """Create the generated/ directory, skipping the syscalls after the first call."""
+    global _ready
+    if not _ready:
+        GENERATED.mkdir(exist_ok=True)
+        _ready = True
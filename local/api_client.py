@@ -1,26 +1,139 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import argparse
 import os
+import random
+import sys
+import time
+from ipaddress import ip_address
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+# Responses worth retrying: rate limiting and transient server-side failures
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def request_with_retry(session, method, url, max_retries=3, backoff_base=1, **kwargs):
+    """Issue an HTTP request, retrying transient failures with backoff + jitter.
+
+    Retries connection errors, timeouts and retryable status codes up to
+    max_retries times, sleeping min(30, base * 2**attempt) seconds between
+    attempts with up to 50% random jitter to avoid synchronized retry storms.
+    Any other response (2xx or a non-retryable 4xx) is returned immediately.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            response = session.request(method, url, **kwargs)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            if attempt == max_retries:
+                return response
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+
+        time.sleep(min(30, backoff_base * 2**attempt) * (1 + random.uniform(0, 0.5)))
+
+
+class TimeoutSession(requests.Session):
+    """Session that applies a default (connect, read) timeout to every request.
+
+    A stalled peer otherwise hangs a call forever, and the retry path never
+    gets the chance to fire.
+    """
+
+    default_timeout = (5, 30)
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(*args, **kwargs)
 
 
 class AlgorandAPIClient:
-    def __init__(self, api_url):
+    # Constant body for requests that carry no parameters
+    _EMPTY_BODY = b"{}"
+
+    def __init__(self, api_url, session=None):
         # If api_url is just a hostname or IP address (no scheme)
         if not api_url.startswith(("http://", "https://")):
-            # Check if it's an IP address
-            is_ip_address = all(c.isdigit() or c == "." for c in api_url)
-            protocol = "http" if is_ip_address else "https"
+            # Literal IPs (v4 or v6) and localhost get plain http to avoid a
+            # doomed TLS handshake in dev setups; real hostnames get https
+            host = api_url.split("/", 1)[0]
+            if host.startswith("["):
+                host = host[1:].split("]", 1)[0]
+            else:
+                host = host.split(":", 1)[0]
+
+            try:
+                ip_address(host)
+                is_ip_address = True
+            except ValueError:
+                is_ip_address = False
+
+            protocol = "http" if is_ip_address or host == "localhost" else "https"
             api_url = f"{protocol}://{api_url}"
 
         self.api_url = api_url
 
-    def health_check(self):
-        """Check if the API is healthy."""
+        # Reuse one pooled session so keep-alive connections survive across
+        # calls instead of paying a TCP+TLS handshake per request; callers may
+        # inject a session so several clients share one connection pool
+        if session is None:
+            session = TimeoutSession()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+        # Every call sends and expects JSON; setting the headers once on the
+        # session avoids rebuilding them (and re-encoding bodies via the
+        # json= kwarg) on each request
+        self.session.headers.update(
+            {"Content-Type": "application/json", "Accept": "application/json"}
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _request_with_retry(self, method, url, **kwargs):
+        """Issue a request on the pooled session, retrying transient failures."""
+        return request_with_retry(self.session, method, url, **kwargs)
+
+    def health_check(self, timeout=None, max_retries=3):
+        """Check if the API is healthy.
+
+        Pass timeout and max_retries=0 for a single fast probe when the
+        caller runs its own retry loop.
+        """
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=10)
+            kwargs = {"max_retries": max_retries}
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            response = self._request_with_retry(
+                "get", f"{self.api_url}/health", **kwargs
+            )
             if response.status_code != 200:
                 print(f"Health check failed with status code: {response.status_code}")
             return response.status_code == 200
@@ -32,10 +145,12 @@ class AlgorandAPIClient:
         """Create a new Algorand account."""
         endpoint = "/api/account/new"
 
-        response = requests.post(f"{self.api_url}{endpoint}", json={})
+        response = self._request_with_retry(
+            "post", f"{self.api_url}{endpoint}", data=self._EMPTY_BODY
+        )
 
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         else:
             raise Exception(f"Error creating account: {response.text}")
 
@@ -44,10 +159,12 @@ class AlgorandAPIClient:
         endpoint = "/api/account/balance"
         data = {"address": address, "mnemonic": mnemonic}
 
-        response = requests.post(f"{self.api_url}{endpoint}", json=data)
+        response = self._request_with_retry(
+            "post", f"{self.api_url}{endpoint}", data=_dumps(data)
+        )
 
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         else:
             raise Exception(f"Error getting balance: {response.text}")
 
@@ -62,14 +179,59 @@ class AlgorandAPIClient:
             "note": note,
         }
 
-        response = requests.post(f"{self.api_url}{endpoint}", json=data)
+        response = self._request_with_retry(
+            "post", f"{self.api_url}{endpoint}", data=_dumps(data)
+        )
 
         if response.status_code in (200, 202):
-            return response.json()
+            return _loads(response.content)
         else:
             raise Exception(f"Error transferring funds: {response.text}")
 
 
+def dumps_for_display(obj):
+    """Serialize obj for stdout, indenting only for interactive terminals."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if sys.stdout.isatty() else 0
+        return orjson.dumps(obj, option=option).decode()
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj)
+
+
+class AlgorandBatch:
+    """Queue independent API calls and execute them concurrently.
+
+    Serial round trips cost N * RTT; running them on a thread pool brings a
+    batch down to roughly one RTT. Results come back in queue order, and a
+    failed call yields its exception instead of aborting the whole batch.
+    """
+
+    def __init__(self, client, max_workers=10):
+        self.client = client
+        self.max_workers = max_workers
+        self.calls = []
+
+    def add(self, method, *args, **kwargs):
+        """Queue a client method call (by name) for concurrent execution."""
+        self.calls.append((method, args, kwargs))
+        return self
+
+    def execute(self):
+        """Run all queued calls concurrently and return results in order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(getattr(self.client, method), *args, **kwargs)
+                for method, args, kwargs in self.calls
+            ]
+
+            results = []
+            for future in futures:
+                error = future.exception()
+                results.append(error if error is not None else future.result())
+            return results
+
+
 def main():
     parser = argparse.ArgumentParser(description="Interact with the Algorand API")
 
@@ -101,6 +263,19 @@ def main():
     )
     transfer_parser.add_argument("--note", default="", help="Optional transaction note")
 
+    # Batch transfer command
+    batch_parser = subparsers.add_parser(
+        "transfer-batch", help="Run transfers from a JSON file concurrently"
+    )
+    batch_parser.add_argument(
+        "--file",
+        required=True,
+        help="JSON file with a list of transfer specs (from/mnemonic/to/amount/note)",
+    )
+    batch_parser.add_argument(
+        "--max-workers", type=int, default=10, help="Concurrent requests to issue"
+    )
+
     args = parser.parse_args()
 
     # Determine API URL
@@ -120,17 +295,38 @@ def main():
     # Execute command
     if args.command == "create-account":
         result = client.create_account()
-        print(json.dumps(result, indent=2))
+        print(dumps_for_display(result))
 
     elif args.command == "balance":
         result = client.get_balance(args.address, args.mnemonic)
-        print(json.dumps(result, indent=2))
+        print(dumps_for_display(result))
 
     elif args.command == "transfer":
         result = client.transfer(
             args.from_address, args.from_mnemonic, args.to, args.amount, args.note
         )
-        print(json.dumps(result, indent=2))
+        print(dumps_for_display(result))
+
+    elif args.command == "transfer-batch":
+        with open(args.file, "r") as f:
+            specs = json.load(f)
+
+        batch = AlgorandBatch(client, max_workers=args.max_workers)
+        for spec in specs:
+            batch.add(
+                "transfer",
+                spec["from"],
+                spec["mnemonic"],
+                spec["to"],
+                spec["amount"],
+                spec.get("note", ""),
+            )
+
+        results = [
+            {"error": str(r)} if isinstance(r, Exception) else r
+            for r in batch.execute()
+        ]
+        print(dumps_for_display(results))
 
     else:
         parser.print_help()
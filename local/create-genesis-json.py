@@ -2,148 +2,75 @@
 
 import json
 import os
-import sys
 import argparse
-import requests
 import time
-from io import StringIO
-import csv
-from decimal import Decimal, getcontext
-from algosdk import account, mnemonic
-import datetime
-
-# Set decimal precision
-getcontext().prec = 28
-
-# Currency name to ISO code mapping (for SDRs per Currency unit section)
-CURRENCY_TO_ISO = {
-    "Chinese yuan": "CNY",
-    "Euro": "EUR",
-    "Japanese yen": "JPY",
-    "U.K. pound": "GBP",
-    "U.S. dollar": "USD",
-    "Algerian dinar": "DZD",
-    "Australian dollar": "AUD",
-    "Botswana pula": "BWP",
-    "Brazilian real": "BRL",
-    "Brunei dollar": "BND",
-    "Canadian dollar": "CAD",
-    "Chilean peso": "CLP",
-    "Czech koruna": "CZK",
-    "Danish krone": "DKK",
-    "Indian rupee": "INR",
-    "Israeli New Shekel": "ILS",
-    "Korean won": "KRW",
-    "Kuwaiti dinar": "KWD",
-    "Malaysian ringgit": "MYR",
-    "Mauritian rupee": "MUR",
-    "Mexican peso": "MXN",
-    "New Zealand dollar": "NZD",
-    "Norwegian krone": "NOK",
-    "Omani rial": "OMR",
-    "Peruvian sol": "PEN",
-    "Philippine peso": "PHP",
-    "Polish zloty": "PLN",
-    "Qatari riyal": "QAR",
-    "Russian ruble": "RUB",
-    "Saudi Arabian riyal": "SAR",
-    "Singapore dollar": "SGD",
-    "South African rand": "ZAR",
-    "Swedish krona": "SEK",
-    "Swiss franc": "CHF",
-    "Thai baht": "THB",
-    "Trinidadian dollar": "TTD",
-    "U.A.E. dirham": "AED",
-    "Uruguayan peso": "UYU",
-}
-
-# Reverse mapping for looking up currency names from ISO codes
-ISO_TO_CURRENCY = {v: k for k, v in CURRENCY_TO_ISO.items()}
-
-
-def download_and_parse_imf_data():
-    """Download IMF exchange rate data and parse it."""
-    url = "https://www.imf.org/external/np/fin/data/rms_five.aspx?tsvflag=Y"
-
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-
-        # Parse the TSV data
-        data = StringIO(response.text)
-        reader = csv.reader(data, delimiter="\t")
-
-        # Skip headers until we reach the currency rates section
-        in_sdrs_per_currency_unit = False
-        exchange_rates = {}
-
-        for row in reader:
-            if not row:
-                continue
-
-            if row[0] == "SDRs per Currency unit (2)":
-                in_sdrs_per_currency_unit = True
-                continue
-
-            if in_sdrs_per_currency_unit:
-                if row[0] == "Currency units per SDR(3)":
-                    break
-
-                if row[0] == "Currency":
-                    continue
-
-                # Extract the most recent exchange rate (first date column with data)
-                currency_name = row[0]
-                rate = None
-
-                for cell in row[1:]:
-                    if cell.strip() and cell != "n.a.":
-                        try:
-                            rate = Decimal(cell)
-                            break
-                        except:
-                            continue
-
-                if rate is not None and currency_name in CURRENCY_TO_ISO:
-                    exchange_rates[CURRENCY_TO_ISO[currency_name]] = rate
-
-        return exchange_rates
-    except requests.RequestException as e:
-        print(f"Error downloading IMF data: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error processing IMF data: {e}")
-        sys.exit(1)
-
-
-def convert_to_sdrs(amount, currency_code, exchange_rates):
-    """Convert a given amount in a specific currency to SDRs."""
-    if currency_code not in exchange_rates:
-        valid_currencies = ", ".join(sorted(exchange_rates.keys()))
-        print(f"Error: Currency code '{currency_code}' not found in IMF data.")
-        print(f"Valid currency codes: {valid_currencies}")
-        sys.exit(1)
-
-    # Convert the amount to Decimal
-    amount_decimal = Decimal(str(amount))
-
-    # SDRs = Amount in currency * SDRs per unit of currency
-    sdrs = amount_decimal * exchange_rates[currency_code]
-    return sdrs
-
-
-def create_genesis_json(amount_xdr, currency):
-    """Create a genesis.json file for a new Algorand network with dedicated accounts."""
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from _paths import GENERATED, ensure_generated_dir
+
+# orjson serializes 3-10x faster and emits bytes directly; fall back to the
+# stdlib encoder when it is not installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+
+
+def secure_write(path, data):
+    """Write bytes to a file created owner-readable only (0o600).
+
+    Creating the file with the final mode avoids the window where a plain
+    open() + chmod() briefly leaves it readable through the default umask.
+    The mode argument only applies on creation, so an existing file from an
+    earlier (laxer) run is tightened explicitly as well.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+def _generate_account_with_mnemonic(_):
+    """Generate one account and derive its mnemonic."""
+    # Deferred: algosdk transitively loads pynacl, which costs hundreds of
+    # milliseconds that --help and argument-error runs should not pay
+    from algosdk import account, mnemonic
+
+    private_key, address = account.generate_account()
+    return private_key, address, mnemonic.from_private_key(private_key)
 
-    # Generate accounts
-    genesis_private_key, genesis_address = account.generate_account()
-    genesis_mnemo = mnemonic.from_private_key(genesis_private_key)
 
-    rewards_private_key, rewards_address = account.generate_account()
-    rewards_mnemo = mnemonic.from_private_key(rewards_private_key)
+def generate_keypairs(count):
+    """Generate count (private key, address, mnemonic) triples concurrently.
 
-    fee_sink_private_key, fee_sink_address = account.generate_account()
-    fee_sink_mnemo = mnemonic.from_private_key(fee_sink_private_key)
+    libsodium's ed25519 keygen releases the GIL, so a thread per account
+    turns three serial keygen+derivation passes into roughly one.
+    """
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(_generate_account_with_mnemonic, range(count)))
+
+
+def create_genesis_json(amount_picoxdr, currency, keypairs=None):
+    """Create a genesis.json file for a new Algorand network with dedicated accounts."""
+    from imf_rates import PICOXDR_PER_XDR
+
+    # Generate accounts (unless pre-generated keypairs were handed in)
+    if keypairs is None:
+        keypairs = generate_keypairs(3)
+
+    (
+        (_genesis_key, genesis_address, genesis_mnemo),
+        (_rewards_key, rewards_address, rewards_mnemo),
+        (_fee_sink_key, fee_sink_address, fee_sink_mnemo),
+    ) = keypairs
 
     # Store accounts in genesis_secrets.json
     genesis_info = {
@@ -152,8 +79,8 @@ def create_genesis_json(amount_xdr, currency):
         "fee_sink": {"address": fee_sink_address, "mnemonic": fee_sink_mnemo},
     }
 
-    # Convert XDR amount to picoXDRs (1 XDR = 1,000,000,000,000 picoXDRs)
-    amount_picoxdr = int(float(amount_xdr) * 1_000_000_000_000)
+    # 1 XDR = 1,000,000,000,000 picoXDRs; the Decimal here is display-only
+    amount_xdr = Decimal(amount_picoxdr) / PICOXDR_PER_XDR
     print(
         f"Initializing genesis account with {amount_xdr} XDR = {amount_picoxdr} picoXDRs"
     )
@@ -179,15 +106,15 @@ def create_genesis_json(amount_xdr, currency):
     }
 
     # Ensure output directory exists
-    os.makedirs("generated", exist_ok=True)
+    ensure_generated_dir()
 
     # Write genesis.json
-    with open("generated/genesis.json", "w") as f:
-        json.dump(genesis_json, f, indent=2)
+    with open(GENERATED / "genesis.json", "wb") as f:
+        f.write(_dumps(genesis_json))
 
-    # Write genesis_secrets.json with all account details
-    with open("generated/genesis_secrets.json", "w") as f:
-        json.dump(genesis_info, f, indent=2)
+    # Write genesis_secrets.json with all account details; it holds mnemonics,
+    # so it must never exist with default permissions
+    secure_write(GENERATED / "genesis_secrets.json", _dumps(genesis_info))
 
     print(f"Genesis files created:")
     print(f"  - generated/genesis.json")
@@ -202,13 +129,43 @@ def main():
         description="Create a genesis.json file for a new Algorand network"
     )
     parser.add_argument(
-        "amount", help="Amount of XDR to initialize in the genesis account"
+        "amount",
+        help="Amount, denominated in the given currency, to initialize in the genesis account",
+    )
+    parser.add_argument(
+        "currency",
+        help="ISO currency code the amount is denominated in (e.g., EUR, USD); converted to XDR via IMF rates",
+    )
+    parser.add_argument(
+        "--imf-cache-ttl",
+        type=int,
+        default=0,
+        help="Reuse cached IMF exchange rates if younger than this many seconds",
     )
-    parser.add_argument("currency", help="Currency code for reference (e.g., EUR, USD)")
 
     args = parser.parse_args()
 
-    create_genesis_json(args.amount, args.currency)
+    # Deferred alongside algosdk: only import the network stack once the
+    # arguments are known to be valid
+    from imf_rates import convert_to_picoxdr, download_and_parse_imf_data
+
+    # The rate download is network-bound and keygen is CPU-bound, and both
+    # release the GIL, so overlapping them hides the keygen cost entirely
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rates_future = executor.submit(
+            download_and_parse_imf_data,
+            args.currency,
+            cache_ttl=args.imf_cache_ttl,
+        )
+        keys_future = executor.submit(generate_keypairs, 3)
+
+        exchange_rates = rates_future.result()
+        keypairs = keys_future.result()
+
+    # Convert the requested amount from the given currency to picoXDRs
+    amount_picoxdr = convert_to_picoxdr(args.amount, args.currency, exchange_rates)
+
+    create_genesis_json(amount_picoxdr, args.currency, keypairs=keypairs)
 
 
 if __name__ == "__main__":
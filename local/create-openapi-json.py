@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+
+"""Generate the OpenAPI spec served at /static/openapi.json.
+
+Run at deploy time (setup.sh) so the API server never rebuilds the spec on
+worker start; fly.toml ships the result to the machine as a static file.
+"""
+
+import gzip
+import json
+
+from _paths import GENERATED, ensure_generated_dir
+
+openapi_spec = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "Algorand XDR Node API",
+        "description": "API for interacting with a private Algorand XDR node",
+        "version": "1.0.0",
+    },
+    "servers": [{"url": "/", "description": "Current server"}],
+    "paths": {
+        "/health": {
+            "get": {
+                "summary": "Health check endpoint",
+                "description": "Check if the API is healthy and connected to the Algorand node",
+                "responses": {
+                    "200": {
+                        "description": "API is healthy",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {
+                                            "type": "string",
+                                            "example": "healthy",
+                                        },
+                                        "node_status": {
+                                            "type": "object",
+                                            "properties": {
+                                                "last_round": {"type": "integer"},
+                                                "time-since-last-round": {
+                                                    "type": "integer"
+                                                },
+                                            },
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "503": {
+                        "description": "API is unhealthy",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "status": {
+                                            "type": "string",
+                                            "example": "unhealthy",
+                                        },
+                                        "error": {"type": "string"},
+                                    },
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+        "/api/account/new": {
+            "post": {
+                "summary": "Create a new Algorand account",
+                "description": "Generates a new Algorand account with address and mnemonic",
+                "responses": {
+                    "200": {
+                        "description": "Account created successfully",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "address": {"type": "string"},
+                                        "mnemonic": {"type": "string"},
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "429": {
+                        "description": "Rate limit exceeded",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Rate limit exceeded",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "500": {
+                        "description": "Server error",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Failed to create account",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+        "/api/account/balance": {
+            "post": {
+                "summary": "Get account balance",
+                "description": "Returns the balance of an Algorand account with mnemonic authentication",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["address", "mnemonic"],
+                                "properties": {
+                                    "address": {
+                                        "type": "string",
+                                        "description": "Algorand account address",
+                                    },
+                                    "mnemonic": {
+                                        "type": "string",
+                                        "description": "Account recovery mnemonic phrase",
+                                    },
+                                },
+                            }
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {
+                        "description": "Account balance retrieved successfully",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "address": {"type": "string"},
+                                        "balance": {
+                                            "type": "integer",
+                                            "description": "Balance in picoXDRs",
+                                        },
+                                        "status": {
+                                            "type": "string",
+                                            "enum": ["active", "offline"],
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "400": {
+                        "description": "Missing required fields",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Missing address or mnemonic",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "403": {
+                        "description": "Invalid authentication",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Invalid mnemonic for address",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "429": {
+                        "description": "Rate limit exceeded",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Rate limit exceeded",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "500": {
+                        "description": "Server error",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Failed to retrieve balance",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+        "/api/transfer": {
+            "post": {
+                "summary": "Transfer funds",
+                "description": "Transfer XDR funds from one account to another",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "required": ["from", "mnemonic", "to", "amount"],
+                                "properties": {
+                                    "from": {
+                                        "type": "string",
+                                        "description": "Sender's Algorand address",
+                                    },
+                                    "mnemonic": {
+                                        "type": "string",
+                                        "description": "Sender's recovery mnemonic",
+                                    },
+                                    "to": {
+                                        "type": "string",
+                                        "description": "Recipient's Algorand address",
+                                    },
+                                    "amount": {
+                                        "type": "integer",
+                                        "description": "Amount in picoXDRs",
+                                    },
+                                    "note": {
+                                        "type": "string",
+                                        "description": "Optional transaction note",
+                                    },
+                                    "wait": {
+                                        "type": "boolean",
+                                        "description": "Block until the transaction is confirmed instead of returning 202 immediately",
+                                        "default": False,
+                                    },
+                                },
+                            }
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {
+                        "description": "Transfer successful",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "tx_id": {
+                                            "type": "string",
+                                            "description": "Transaction ID",
+                                        },
+                                        "status": {
+                                            "type": "string",
+                                            "enum": ["confirmed", "pending"],
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "202": {
+                        "description": "Transfer pending",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "tx_id": {
+                                            "type": "string",
+                                            "description": "Transaction ID",
+                                        },
+                                        "status": {
+                                            "type": "string",
+                                            "example": "pending",
+                                        },
+                                        "poll": {
+                                            "type": "string",
+                                            "description": "URL to poll for the confirmation status",
+                                        },
+                                        "error": {"type": "string"},
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "400": {
+                        "description": "Invalid request",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Missing required fields",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "403": {
+                        "description": "Invalid authentication",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Invalid mnemonic for sender address",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "429": {
+                        "description": "Rate limit exceeded",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Rate limit exceeded",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "500": {
+                        "description": "Server error",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "error": {
+                                            "type": "string",
+                                            "example": "Failed to transfer funds",
+                                        }
+                                    },
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+        "/api/transfer/batch": {
+            "post": {
+                "summary": "Transfer funds in batch",
+                "description": "Submit up to 16 independent transfers in one request; each is relayed to the node separately",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "required": ["from", "mnemonic", "to", "amount"],
+                                    "properties": {
+                                        "from": {"type": "string"},
+                                        "mnemonic": {"type": "string"},
+                                        "to": {"type": "string"},
+                                        "amount": {"type": "integer"},
+                                        "note": {"type": "string"},
+                                    },
+                                },
+                            }
+                        }
+                    },
+                },
+                "responses": {
+                    "202": {
+                        "description": (
+                            "Batch accepted; results are in entry order. Poll"
+                            " each tx_id via /api/tx/{tx_id}. Entries that"
+                            " failed to submit carry an error instead of a"
+                            " tx_id"
+                        ),
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "tx_id": {"type": "string"},
+                                            "status": {
+                                                "type": "string",
+                                                "example": "pending",
+                                            },
+                                            "error": {"type": "string"},
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "400": {
+                        "description": "Invalid request",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"error": {"type": "string"}},
+                                }
+                            }
+                        },
+                    },
+                    "403": {
+                        "description": "Invalid authentication",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"error": {"type": "string"}},
+                                }
+                            }
+                        },
+                    },
+                    "429": {
+                        "description": "Rate limit exceeded",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"error": {"type": "string"}},
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+        "/api/tx/{tx_id}": {
+            "get": {
+                "summary": "Poll transaction status",
+                "description": "Check whether a transaction submitted via /api/transfer has been confirmed",
+                "parameters": [
+                    {
+                        "name": "tx_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"},
+                        "description": "Transaction ID returned by /api/transfer",
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Transaction confirmed or failed",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "tx_id": {"type": "string"},
+                                        "status": {
+                                            "type": "string",
+                                            "enum": ["confirmed", "failed"],
+                                        },
+                                        "confirmed_round": {"type": "integer"},
+                                        "error": {"type": "string"},
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "202": {
+                        "description": "Transaction still pending",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "tx_id": {"type": "string"},
+                                        "status": {
+                                            "type": "string",
+                                            "example": "pending",
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "404": {
+                        "description": "Transaction unknown to the node",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"error": {"type": "string"}},
+                                }
+                            }
+                        },
+                    },
+                },
+            }
+        },
+    },
+}
+
+
+def main():
+    ensure_generated_dir()
+    data = json.dumps(openapi_spec).encode()
+    with open(GENERATED / "openapi.json", "wb") as f:
+        f.write(data)
+    # Pre-compress so the server never gzips the spec at request time
+    with open(GENERATED / "openapi.json.gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9))
+    print(f"OpenAPI spec written to {GENERATED / 'openapi.json'} (+.gz)")
+
+
+if __name__ == "__main__":
+    main()
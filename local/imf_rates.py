@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+"""IMF SDR exchange-rate download, caching and conversion helpers."""
+
+import csv
+import json
+import re
+import sys
+import time
+from decimal import Decimal, getcontext
+from types import MappingProxyType
+
+import requests
+
+from _paths import GENERATED, ensure_generated_dir
+from api_client import TimeoutSession, request_with_retry
+
+# Set decimal precision
+getcontext().prec = 28
+
+# Currency name to ISO code mapping (for SDRs per Currency unit section),
+# frozen read-only so importers can share it safely
+CURRENCY_TO_ISO = MappingProxyType(
+    {
+        "Chinese yuan": "CNY",
+        "Euro": "EUR",
+        "Japanese yen": "JPY",
+        "U.K. pound": "GBP",
+        "U.S. dollar": "USD",
+        "Algerian dinar": "DZD",
+        "Australian dollar": "AUD",
+        "Botswana pula": "BWP",
+        "Brazilian real": "BRL",
+        "Brunei dollar": "BND",
+        "Canadian dollar": "CAD",
+        "Chilean peso": "CLP",
+        "Czech koruna": "CZK",
+        "Danish krone": "DKK",
+        "Indian rupee": "INR",
+        "Israeli New Shekel": "ILS",
+        "Korean won": "KRW",
+        "Kuwaiti dinar": "KWD",
+        "Malaysian ringgit": "MYR",
+        "Mauritian rupee": "MUR",
+        "Mexican peso": "MXN",
+        "New Zealand dollar": "NZD",
+        "Norwegian krone": "NOK",
+        "Omani rial": "OMR",
+        "Peruvian sol": "PEN",
+        "Philippine peso": "PHP",
+        "Polish zloty": "PLN",
+        "Qatari riyal": "QAR",
+        "Russian ruble": "RUB",
+        "Saudi Arabian riyal": "SAR",
+        "Singapore dollar": "SGD",
+        "South African rand": "ZAR",
+        "Swedish krona": "SEK",
+        "Swiss franc": "CHF",
+        "Thai baht": "THB",
+        "Trinidadian dollar": "TTD",
+        "U.A.E. dirham": "AED",
+        "Uruguayan peso": "UYU",
+    }
+)
+
+# Reverse mapping for looking up currency names from ISO codes
+ISO_TO_CURRENCY = MappingProxyType({v: k for k, v in CURRENCY_TO_ISO.items()})
+
+# Plain decimal number, as found in the IMF rate columns
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?$")
+
+# 1 XDR = 1,000,000,000,000 picoXDRs
+PICOXDR_PER_XDR = Decimal(10) ** 12
+
+# Exchange rates are stored as ints scaled by this factor, so conversions are
+# plain integer multiplies instead of Decimal context arithmetic
+RATE_SCALE = 10**18
+
+
+# On-disk cache for the IMF TSV so warm runs skip the download entirely
+IMF_CACHE_TSV = GENERATED / ".imf_cache.tsv"
+IMF_CACHE_META = GENERATED / ".imf_cache.json"
+
+
+def _load_imf_cache_meta():
+    """Load the cached IMF metadata, if both cache files are present."""
+    try:
+        with open(IMF_CACHE_META, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not IMF_CACHE_TSV.exists():
+        return None
+    return meta
+
+
+def _store_imf_cache_meta(response):
+    """Persist the validator headers for future conditional requests."""
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": int(time.time()),
+    }
+    with open(IMF_CACHE_META, "w") as f:
+        json.dump(meta, f)
+
+
+def _parse_cached_imf_tsv(target_iso=None):
+    """Parse exchange rates from the on-disk cache without loading it whole."""
+    with open(IMF_CACHE_TSV, "r", newline="") as f:
+        return _parse_imf_lines(f, target_iso)
+
+
+def _tee_lines(response, cache_file):
+    """Yield decoded response lines while mirroring them into the cache file."""
+    for line in response.iter_lines(decode_unicode=True):
+        cache_file.write(line + "\n")
+        yield line
+
+
+def download_and_parse_imf_data(target_iso=None, cache_ttl=0):
+    """Download IMF exchange rate data and parse it.
+
+    Uses a disk cache: within cache_ttl seconds of the last fetch the network
+    is skipped entirely, and afterwards a conditional request (If-None-Match /
+    If-Modified-Since) lets the server answer 304 instead of resending the body.
+
+    When target_iso is given, parsing stops as soon as that currency's rate is
+    found instead of materializing all ~38 rates. Rates are returned as ints
+    scaled by RATE_SCALE.
+    """
+    url = "https://www.imf.org/external/np/fin/data/rms_five.aspx?tsvflag=Y"
+
+    meta = _load_imf_cache_meta()
+
+    # Fresh enough: skip the network round trip entirely
+    if meta is not None and cache_ttl > 0:
+        if int(time.time()) - meta.get("fetched_at", 0) < cache_ttl:
+            return _parse_cached_imf_tsv(target_iso)
+
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        with TimeoutSession() as session:
+            with request_with_retry(
+                session, "get", url, headers=headers, stream=True
+            ) as response:
+                if response.status_code == 304 and meta is not None:
+                    # The server revalidated the cache: refresh fetched_at so
+                    # the TTL short-circuit works again, keeping the stored
+                    # validators (a 304 need not repeat them)
+                    meta["fetched_at"] = int(time.time())
+                    with open(IMF_CACHE_META, "w") as f:
+                        json.dump(meta, f)
+                    return _parse_cached_imf_tsv(target_iso)
+
+                response.raise_for_status()
+
+                # Stream-parse while teeing lines into the cache, so parsing
+                # overlaps the network receive and the body is never held in
+                # memory twice
+                ensure_generated_dir()
+                with open(IMF_CACHE_TSV, "w", newline="") as cache_file:
+                    tee = _tee_lines(response, cache_file)
+                    exchange_rates = _parse_imf_lines(tee, target_iso)
+                    # Keep mirroring any unparsed remainder so the cache stays
+                    # complete for runs that target a different currency
+                    for _ in tee:
+                        pass
+                _store_imf_cache_meta(response)
+
+        return exchange_rates
+    except requests.RequestException as e:
+        print(f"Error downloading IMF data: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error processing IMF data: {e}")
+        sys.exit(1)
+
+
+def _parse_imf_lines(lines, target_iso=None):
+    """Parse the 'SDRs per Currency unit' section from an iterable of TSV lines.
+
+    Stops early once target_iso's rate is found, if one is given.
+    """
+    target_name = ISO_TO_CURRENCY.get(target_iso) if target_iso else None
+    try:
+        reader = csv.reader(lines, delimiter="\t")
+
+        # Skip headers until we reach the currency rates section
+        in_sdrs_per_currency_unit = False
+        exchange_rates = {}
+
+        for row in reader:
+            if not row:
+                continue
+
+            if row[0] == "SDRs per Currency unit (2)":
+                in_sdrs_per_currency_unit = True
+                continue
+
+            if in_sdrs_per_currency_unit:
+                if row[0] == "Currency units per SDR(3)":
+                    break
+
+                if row[0] == "Currency":
+                    continue
+
+                # Extract the most recent exchange rate (first date column with data)
+                currency_name = row[0]
+                rate = None
+
+                for cell in row[1:]:
+                    # Cheap regex pre-filter beats raising/catching on every
+                    # empty or "n.a." cell
+                    s = cell.strip()
+                    if not s or not _NUM_RE.match(s):
+                        continue
+                    # Scale to int once here; all later math stays integer
+                    rate = int(Decimal(s) * RATE_SCALE)
+                    break
+
+                if rate is not None and currency_name in CURRENCY_TO_ISO:
+                    exchange_rates[CURRENCY_TO_ISO[currency_name]] = rate
+                    # Found the only rate the caller needs; stop parsing
+                    if target_name and currency_name == target_name:
+                        return exchange_rates
+
+        return exchange_rates
+    except Exception as e:
+        print(f"Error processing IMF data: {e}")
+        sys.exit(1)
+
+
+def convert_to_picoxdr(amount, currency_code, exchange_rates):
+    """Convert an amount in a specific currency to integer picoXDRs.
+
+    Decimal is used once to scale the input amount; the conversion itself is
+    a single integer multiply and floor divide against the pre-scaled rate.
+    """
+    if currency_code not in exchange_rates:
+        valid_currencies = ", ".join(sorted(exchange_rates.keys()))
+        print(f"Error: Currency code '{currency_code}' not found in IMF data.")
+        print(f"Valid currency codes: {valid_currencies}")
+        sys.exit(1)
+
+    # Scale the currency amount to pico-units, then apply the scaled rate
+    amount_pico_units = int(Decimal(str(amount)) * PICOXDR_PER_XDR)
+    return amount_pico_units * exchange_rates[currency_code] // RATE_SCALE
@@ -1,77 +1,176 @@
 #!/usr/bin/env python3
 
 import unittest
+import functools
 import json
 import os
+import pathlib
 import time
 import requests
 import subprocess
 import re
 import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from api_client import AlgorandAPIClient
 
 
-def determine_api_host():
-    """Determine the API host using fly CLI and config."""
-    # Get app name from fly.toml
+# Resolved-host cache: skips the fly CLI subprocess and DNS retries on
+# warm runs within the TTL window
+HOST_CACHE_FILE = "generated/api_host.cache"
+HOST_CACHE_TTL = 900  # seconds
+
+
+def _load_cached_host(path=HOST_CACHE_FILE, ttl=HOST_CACHE_TTL):
+    """Return the cached host if the cache file exists and is fresh."""
     try:
-        with open("fly.toml", "r") as f:
-            for line in f:
-                if line.startswith("app = "):
-                    app_name = line.split("=")[1].strip().strip("'\"")
-                    break
-    except:
-        app_name = "algorand-node"  # Default fallback
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
 
-    print(f"Using app name: {app_name}")
+    if time.time() - entry.get("ts", 0) < ttl:
+        return entry.get("host")
+    return None
 
-    # Get the IP address directly from Fly CLI
-    print(f"Getting IP address for {app_name}...")
+
+def _store_cached_host(host, path=HOST_CACHE_FILE):
+    """Persist a successfully resolved host with the current timestamp."""
+    try:
+        os.makedirs("generated", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"host": host, "ts": int(time.time())}, f)
+    except OSError:
+        pass
+
+
+# Matches the app name assignment at the top of fly.toml
+_APP_RE = re.compile(r"^app\s*=\s*['\"]([^'\"]+)['\"]", re.M)
+
+# Matches the v4 address row in `fly ips list` output; kept as bytes so the
+# subprocess output never needs a full text decode
+_V4_RE = re.compile(rb"v4\s+([0-9.]+)")
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_name():
+    """Read the app name from fly.toml, once per process."""
+    try:
+        match = _APP_RE.search(pathlib.Path("fly.toml").read_text())
+        if match:
+            return match.group(1)
+    except OSError:
+        pass
+    return "algorand-node"  # Default fallback
+
+
+def _fly_ip(app_name):
+    """Look up the app's IPv4 address via the fly CLI, or return None."""
     try:
         result = subprocess.run(
             ["fly", "ips", "list", "--app", app_name],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stderr=subprocess.DEVNULL,
             timeout=10,
         )
         if result.returncode == 0:
             # Extract IP from the output
-            ip_match = re.search(r"v4\s+([0-9.]+)", result.stdout)
+            ip_match = _V4_RE.search(result.stdout)
             if ip_match:
-                ip_address = ip_match.group(1)
-                print(f"Using Fly.io app IP address: {ip_address}")
-                return ip_address
+                return ip_match.group(1).decode()
     except Exception as e:
         print(f"Could not get IP address: {e}")
+    return None
 
-    # If we can't get IP, try the domain
-    fly_host = f"{app_name}.fly.dev"
 
-    # Try to resolve the hostname
-    MAX_RETRY_ATTEMPTS = 10
-    RETRY_DELAY = 3  # seconds
+def _retry_with_backoff(fn, timeout=60, base=0.25, cap=5.0):
+    """Call fn until it returns a truthy value or the deadline passes.
 
-    print(
-        f"Attempting to resolve host {fly_host}... (max {MAX_RETRY_ATTEMPTS} attempts)"
-    )
+    The delay between attempts doubles from base up to cap seconds, so fast
+    startups are detected in fractions of a second while slow ones still get
+    the full timeout window. Returns fn's last result.
+    """
+    deadline = time.monotonic() + timeout
+    delay = base
 
-    for attempt in range(MAX_RETRY_ATTEMPTS):
-        try:
-            # Try to resolve the hostname to check if DNS is working
-            socket.gethostbyname(fly_host)
-            print(f"Host {fly_host} successfully resolved on attempt {attempt+1}")
+    while True:
+        result = fn()
+        if result or time.monotonic() + delay >= deadline:
+            return result
+
+        time.sleep(delay)
+        delay = min(delay * 2, cap)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_ip(host):
+    """Resolve host to an address, caching successes in-process.
+
+    The libc resolver behind gethostbyname keeps no per-process cache, so
+    naive retries re-query DNS every time; lru_cache only memoizes successful
+    lookups (exceptions are not cached), which is exactly what retry loops
+    want.
+    """
+    return socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0][4][0]
+
+
+def _resolve_host(fly_host):
+    """Resolve fly_host once, returning it on success or None on failure."""
+    try:
+        _resolve_ip(fly_host)
+        return fly_host
+    except socket.gaierror:
+        return None
+
+
+def determine_api_host():
+    """Determine the API host using fly CLI and config.
+
+    Set the API_HOST (or ALGOD_HOST) environment variable to skip discovery
+    entirely, e.g. in CI where the host is already known.
+    """
+    env_host = os.environ.get("API_HOST") or os.environ.get("ALGOD_HOST")
+    if env_host:
+        print(f"Using API host from environment: {env_host}")
+        return env_host
+
+    # Fresh cached result: skip the subprocess and DNS work entirely
+    cached_host = _load_cached_host()
+    if cached_host:
+        print(f"Using cached API host: {cached_host}")
+        return cached_host
+
+    app_name = get_app_name()
+    print(f"Using app name: {app_name}")
+
+    fly_host = f"{app_name}.fly.dev"
+
+    # The fly CLI lookup and the DNS resolve are independent IO-bound waits,
+    # so probe both concurrently and take whichever viable answer comes back
+    print(f"Probing {app_name} via fly CLI and DNS concurrently...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ip_future = executor.submit(_fly_ip, app_name)
+        dns_future = executor.submit(_resolve_host, fly_host)
+
+        ip_address = ip_future.result()
+        if ip_address:
+            print(f"Using Fly.io app IP address: {ip_address}")
+            _store_cached_host(ip_address)
+            return ip_address
+
+        if dns_future.result():
+            print(f"Host {fly_host} successfully resolved")
+            _store_cached_host(fly_host)
             return fly_host
-        except socket.gaierror as e:
-            if attempt < MAX_RETRY_ATTEMPTS - 1:
-                print(
-                    f"Attempt {attempt+1}/{MAX_RETRY_ATTEMPTS} failed to resolve {fly_host}: {e}"
-                )
-                print(f"Waiting {RETRY_DELAY} seconds before retrying...")
-                time.sleep(RETRY_DELAY)
-            else:
-                print(f"All {MAX_RETRY_ATTEMPTS} attempts to resolve {fly_host} failed")
+
+    # Neither probe succeeded; keep retrying DNS with backoff for a while
+    print(f"Attempting to resolve host {fly_host}... (up to 30s)")
+
+    if _retry_with_backoff(lambda: _resolve_host(fly_host), timeout=30):
+        print(f"Host {fly_host} successfully resolved")
+        _store_cached_host(fly_host)
+        return fly_host
 
     print("\n⚠️  WARNING: Could not resolve hostname after multiple attempts")
     print("\nTROUBLESHOOTING SUGGESTIONS:")
@@ -83,8 +182,13 @@ def determine_api_host():
     return fly_host
 
 
+@functools.lru_cache(maxsize=1)
 def load_genesis_secrets():
-    """Load genesis account information from generated file."""
+    """Load genesis account information from generated file.
+
+    Cached so repeated setUpClass runs parse the file once per process; the
+    returned (address, mnemonic) tuple is immutable and safe to share.
+    """
     genesis_secrets_file = "generated/genesis_secrets.json"
 
     if not os.path.exists(genesis_secrets_file):
@@ -112,21 +216,67 @@ def load_genesis_secrets():
         sys.exit(1)
 
 
+def _local_account():
+    """Generate an account locally, shaped like the server's /api/account/new.
+
+    Account creation is pure keypair generation with no server-side state, so
+    a local algosdk call gives the same result without the HTTP round trip.
+    """
+    from algosdk import account, mnemonic
+
+    private_key, address = account.generate_account()
+    return {"address": address, "mnemonic": mnemonic.from_private_key(private_key)}
+
+
+@functools.lru_cache(maxsize=1)
+def shared_context():
+    """Resolve the host, load genesis secrets and build the client once.
+
+    Host discovery (subprocess + DNS) and the secrets read are the expensive
+    parts of setUpClass; caching them lets every test class in one unittest
+    invocation share a single pass and a single pooled client.
+    """
+    genesis_address, genesis_mnemonic = load_genesis_secrets()
+    api_host = determine_api_host()
+
+    return {
+        "api_host": api_host,
+        "api_client": AlgorandAPIClient(api_host),
+        "genesis_address": genesis_address,
+        "genesis_mnemonic": genesis_mnemonic,
+    }
+
+
+def close_shared_client():
+    """Close the shared client's pooled HTTP session, if one was built.
+
+    The client is shared across every test class (and both parallel
+    chains), so tearDownClass must not close it: the first chain to
+    finish would yank the session out from under the other's in-flight
+    requests. It is closed here exactly once, after all tests are done.
+    """
+    if shared_context.cache_info().currsize:
+        shared_context()["api_client"].close()
+
+
 class AlgorandAPITest(unittest.TestCase):
+    # Constant transaction notes, built once instead of per call
+    _TRANSFER_NOTE = "Test transfer"
+    _FUND_NOTE = "Fund for multi-account test"
+    _BETWEEN_NOTE = "Transfer between test accounts"
+
     @classmethod
     def setUpClass(cls):
         """Set up test environment - connect to the API and ensure it's healthy."""
-        # Get required values from configuration files
-        cls.genesis_address, cls.genesis_mnemonic = load_genesis_secrets()
-
-        cls.api_host = determine_api_host()
+        ctx = shared_context()
+        cls.genesis_address = ctx["genesis_address"]
+        cls.genesis_mnemonic = ctx["genesis_mnemonic"]
+        cls.api_host = ctx["api_host"]
+        cls.api_client = ctx["api_client"]
 
         # Test parameters
         cls.test_transfer_amount = 1000000  # 1 picoXDR = 1 microAlgo
 
-        # Create API client
-        cls.api_client = AlgorandAPIClient(cls.api_host)
-
         print(f"Using API at: {cls.api_client.api_url}")
         print(f"Using Genesis address: {cls.genesis_address}")
 
@@ -135,32 +285,22 @@ class AlgorandAPITest(unittest.TestCase):
 
     @classmethod
     def wait_for_api_health(cls):
-        """Wait for the API to become healthy with retries."""
-        MAX_RETRY_ATTEMPTS = 15  # More retries for initial setup
-        RETRY_DELAY = 5  # seconds
+        """Wait for the API to become healthy, backing off between probes."""
+        print("Waiting for API to be healthy (up to 75s)...")
 
-        print(f"Waiting for API to be healthy (max {MAX_RETRY_ATTEMPTS} attempts)...")
-
-        for attempt in range(MAX_RETRY_ATTEMPTS):
+        def probe():
             try:
-                if cls.api_client.health_check():
-                    print(
-                        f"✅ API is healthy! (attempt {attempt+1}/{MAX_RETRY_ATTEMPTS})"
-                    )
-                    return
-                else:
-                    print(
-                        f"❌ API unhealthy on attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}"
-                    )
+                # Single short-timeout attempt per probe: the backoff loop
+                # owns retrying, and the pooled session keeps the socket
+                # alive between attempts once the server is reachable
+                return cls.api_client.health_check(timeout=2, max_retries=0)
             except Exception as e:
-                print(
-                    f"❌ Connection error on attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}: {e}"
-                )
+                print(f"❌ Connection error during health check: {e}")
+                return False
 
-            # Last attempt - don't sleep
-            if attempt < MAX_RETRY_ATTEMPTS - 1:
-                print(f"Waiting {RETRY_DELAY} seconds before next health check...")
-                time.sleep(RETRY_DELAY)
+        if _retry_with_backoff(probe, timeout=75):
+            print("✅ API is healthy!")
+            return
 
         # If we get here, we couldn't connect after all retries
         print("\n⚠️  WARNING: Could not verify API health after multiple attempts")
@@ -170,10 +310,15 @@ class AlgorandAPITest(unittest.TestCase):
         print("2. Check server logs with 'fly logs'")
         print("3. Make sure the server is properly configured")
 
-    def create_test_account(self):
-        """Helper to create a test account for any test that needs one."""
-        # Create a new account
-        account_info = self.api_client.create_account()
+    def create_test_account(self, remote=False):
+        """Helper to create a test account for any test that needs one.
+
+        Accounts are generated locally by default; pass remote=True to
+        exercise the server's /api/account/new endpoint instead.
+        """
+        account_info = (
+            self.api_client.create_account() if remote else _local_account()
+        )
 
         # Validate the response
         self.assertIn("address", account_info)
@@ -191,8 +336,8 @@ class AlgorandAPITest(unittest.TestCase):
     def test_02_create_account(self):
         """Test account creation."""
         try:
-            # Create a test account and verify it
-            account_info = self.create_test_account()
+            # Create a test account via the API and verify it
+            account_info = self.create_test_account(remote=True)
             self.assertIsNotNone(account_info, "Should create a valid account")
         except Exception as e:
             self.fail(f"Failed to create account: {e}")
@@ -224,7 +369,7 @@ class AlgorandAPITest(unittest.TestCase):
                 self.genesis_mnemonic,
                 test_account["address"],
                 self.test_transfer_amount,
-                "Test transfer",
+                self._TRANSFER_NOTE,
             )
 
             # Check result
@@ -272,7 +417,7 @@ class AlgorandAPITest(unittest.TestCase):
                 self.genesis_mnemonic,
                 account1["address"],
                 self.test_transfer_amount * 2,  # Double for transfer between accounts
-                "Fund for multi-account test",
+                self._FUND_NOTE,
             )
 
             # Wait for confirmation
@@ -287,7 +432,7 @@ class AlgorandAPITest(unittest.TestCase):
                 account1["mnemonic"],
                 account2["address"],
                 transfer_amount,
-                "Transfer between test accounts",
+                self._BETWEEN_NOTE,
             )
 
             # Wait for confirmation
@@ -312,5 +457,53 @@ class AlgorandAPITest(unittest.TestCase):
             self.fail(f"Failed in multiple account test: {e}")
 
 
+# Tests within a chain must stay ordered; distinct chains are independent of
+# each other and can run on separate threads over the shared pooled session
+_PARALLEL_CHAINS = (
+    (
+        "test_01_health_check",
+        "test_02_create_account",
+        "test_03_check_genesis_balance",
+    ),
+    (
+        "test_04_transfer_funds",
+        "test_05_multiple_accounts",
+    ),
+)
+
+
+def _run_chain(test_names):
+    """Run one ordered chain of tests, buffering its report output."""
+    suite = unittest.TestSuite(AlgorandAPITest(name) for name in test_names)
+    stream = StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def run_parallel():
+    """Run the independent test chains concurrently.
+
+    Wall time drops to roughly the longest chain instead of the sum of all
+    tests, since each chain spends most of its time waiting on the network.
+    """
+    # Resolve host/secrets up front so the chains do not race through setup
+    shared_context()
+
+    with ThreadPoolExecutor(max_workers=len(_PARALLEL_CHAINS)) as executor:
+        outcomes = list(executor.map(_run_chain, _PARALLEL_CHAINS))
+    close_shared_client()
+
+    all_ok = True
+    for ok, output in outcomes:
+        sys.stderr.write(output)
+        all_ok = all_ok and ok
+    sys.exit(0 if all_ok else 1)
+
+
 if __name__ == "__main__":
-    unittest.main()
+    if "--parallel" in sys.argv:
+        run_parallel()
+    try:
+        unittest.main()
+    finally:
+        close_shared_client()
@@ -66,10 +66,15 @@ EOF
   chmod 600 "$CONFIG_FILE"
 fi
 
-# Copy the server API script
+# Copy the server API script, its gunicorn config and the static assets
 log "Setting up the secure API server..."
 cp /app/server_api.py /algod/server_api.py
 chmod 700 /algod/server_api.py
+cp /app/gunicorn_conf.py /algod/gunicorn_conf.py
+chmod 700 /algod/gunicorn_conf.py
+mkdir -p /algod/static
+cp /app/static/openapi.json /algod/static/openapi.json
+cp /app/static/openapi.json.gz /algod/static/openapi.json.gz
 
 # Start the Algorand node in the background
 log "Starting Algorand node..."
@@ -82,7 +87,9 @@ sleep 5
 
 # Start the API server in the background
 log "Starting secure API server..."
-gunicorn --bind 0.0.0.0:3000 --workers 4 --access-logfile - --error-logfile - "server_api:app" &
+# Worker class, count and timeouts live in gunicorn_conf.py, which also
+# exports API_WORKERS so the app can split its rate-limit buckets.
+gunicorn -c /algod/gunicorn_conf.py --bind 0.0.0.0:3000 --access-logfile - --error-logfile - "server_api:app" &
 GUNICORN_PID=$!
 
 # Wait for either process to exit
@@ -1,17 +1,49 @@
 #!/usr/bin/env python3
 
 import os
-import json
 import time
+import hashlib
+import hmac
+import queue
+import threading
 import traceback
-from flask import Flask, request, jsonify, send_from_directory, redirect
-from algosdk import account, mnemonic, encoding
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from flask import Flask, g, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
+from algosdk import account, mnemonic, encoding, constants, error
 from algosdk.v2client import algod
+from algosdk.v2client.algod import api_version_path_prefix
 from algosdk.transaction import PaymentTxn
 from flask_swagger_ui import get_swaggerui_blueprint
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C encoder.
+
+    jsonify and request.get_json() run on every endpoint; orjson serializes
+    straight to bytes, skipping the pure-Python encoder and the str->bytes
+    encode on the way out.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Configure Swagger UI
 SWAGGER_URL = ""  # URL for exposing Swagger UI
 API_URL = "/static/openapi.json"  # Our API url where OpenAPI spec is served
@@ -21,478 +53,304 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 )
 app.register_blueprint(swaggerui_blueprint)
 
-# Ensure static folder exists
-os.makedirs(
-    os.path.join(os.path.dirname(os.path.abspath(__file__)), "static"), exist_ok=True
-)
-
-# Create OpenAPI specification
-openapi_spec = {
-    "openapi": "3.0.0",
-    "info": {
-        "title": "Algorand XDR Node API",
-        "description": "API for interacting with a private Algorand XDR node",
-        "version": "1.0.0",
-    },
-    "servers": [{"url": "/", "description": "Current server"}],
-    "paths": {
-        "/health": {
-            "get": {
-                "summary": "Health check endpoint",
-                "description": "Check if the API is healthy and connected to the Algorand node",
-                "responses": {
-                    "200": {
-                        "description": "API is healthy",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "status": {
-                                            "type": "string",
-                                            "example": "healthy",
-                                        },
-                                        "node_status": {
-                                            "type": "object",
-                                            "properties": {
-                                                "last_round": {"type": "integer"},
-                                                "time-since-last-round": {
-                                                    "type": "integer"
-                                                },
-                                            },
-                                        },
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "503": {
-                        "description": "API is unhealthy",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "status": {
-                                            "type": "string",
-                                            "example": "unhealthy",
-                                        },
-                                        "error": {"type": "string"},
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-            }
-        },
-        "/api/account/new": {
-            "post": {
-                "summary": "Create a new Algorand account",
-                "description": "Generates a new Algorand account with address and mnemonic",
-                "responses": {
-                    "200": {
-                        "description": "Account created successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "address": {"type": "string"},
-                                        "mnemonic": {"type": "string"},
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "429": {
-                        "description": "Rate limit exceeded",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Rate limit exceeded",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "500": {
-                        "description": "Server error",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Failed to create account",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-            }
-        },
-        "/api/account/balance": {
-            "post": {
-                "summary": "Get account balance",
-                "description": "Returns the balance of an Algorand account with mnemonic authentication",
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "required": ["address", "mnemonic"],
-                                "properties": {
-                                    "address": {
-                                        "type": "string",
-                                        "description": "Algorand account address",
-                                    },
-                                    "mnemonic": {
-                                        "type": "string",
-                                        "description": "Account recovery mnemonic phrase",
-                                    },
-                                },
-                            }
-                        }
-                    },
-                },
-                "responses": {
-                    "200": {
-                        "description": "Account balance retrieved successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "address": {"type": "string"},
-                                        "balance": {
-                                            "type": "integer",
-                                            "description": "Balance in picoXDRs",
-                                        },
-                                        "status": {
-                                            "type": "string",
-                                            "enum": ["active", "offline"],
-                                        },
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "400": {
-                        "description": "Missing required fields",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Missing address or mnemonic",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Invalid authentication",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Invalid mnemonic for address",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "429": {
-                        "description": "Rate limit exceeded",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Rate limit exceeded",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "500": {
-                        "description": "Server error",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Failed to retrieve balance",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-            }
-        },
-        "/api/transfer": {
-            "post": {
-                "summary": "Transfer funds",
-                "description": "Transfer XDR funds from one account to another",
-                "requestBody": {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "required": ["from", "mnemonic", "to", "amount"],
-                                "properties": {
-                                    "from": {
-                                        "type": "string",
-                                        "description": "Sender's Algorand address",
-                                    },
-                                    "mnemonic": {
-                                        "type": "string",
-                                        "description": "Sender's recovery mnemonic",
-                                    },
-                                    "to": {
-                                        "type": "string",
-                                        "description": "Recipient's Algorand address",
-                                    },
-                                    "amount": {
-                                        "type": "integer",
-                                        "description": "Amount in picoXDRs",
-                                    },
-                                    "note": {
-                                        "type": "string",
-                                        "description": "Optional transaction note",
-                                    },
-                                },
-                            }
-                        }
-                    },
-                },
-                "responses": {
-                    "200": {
-                        "description": "Transfer successful",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "tx_id": {
-                                            "type": "string",
-                                            "description": "Transaction ID",
-                                        },
-                                        "status": {
-                                            "type": "string",
-                                            "enum": ["confirmed", "pending"],
-                                        },
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "202": {
-                        "description": "Transfer pending",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "tx_id": {
-                                            "type": "string",
-                                            "description": "Transaction ID",
-                                        },
-                                        "status": {
-                                            "type": "string",
-                                            "example": "pending",
-                                        },
-                                        "error": {"type": "string"},
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "400": {
-                        "description": "Invalid request",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Missing required fields",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Invalid authentication",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Invalid mnemonic for sender address",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "429": {
-                        "description": "Rate limit exceeded",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Rate limit exceeded",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "500": {
-                        "description": "Server error",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "error": {
-                                            "type": "string",
-                                            "example": "Failed to transfer funds",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-            }
-        },
-    },
-}
-
-# Write the OpenAPI spec to a file
-with open(
-    os.path.join(os.path.dirname(os.path.abspath(__file__)), "static/openapi.json"), "w"
-) as f:
-    json.dump(openapi_spec, f)
-
-# Rate limiting settings
+# Rate limiting settings: a token bucket per client IP, refilled lazily on
+# access so each check is O(1) with no periodic sweep over all clients
 REQUEST_LIMIT = 100
 RATE_WINDOW = 3600  # 1 hour in seconds
-request_counts = {}
-
-# Algorand client setup
+# Each gunicorn worker keeps its own buckets (gunicorn_conf.py exports
+# API_WORKERS alongside its worker count). Only the sustained refill is
+# split across workers: keep-alive connections pin a client to one worker,
+# so dividing the burst capacity too would throttle a well-behaved session
+# after a handful of calls. The cost is bounded over-admission -- at most
+# one extra full bucket per additional worker a client reaches
+_WORKERS = max(1, int(os.environ.get("API_WORKERS", "1")))
+BUCKET_CAPACITY = REQUEST_LIMIT
+REFILL_RATE = REQUEST_LIMIT / _WORKERS / RATE_WINDOW  # tokens per second
+# Hard cap on tracked clients: evicting the least-recently-seen IP keeps the
+# limiter's memory constant even under one-request-per-IP floods
+MAX_TRACKED_IPS = 10000
+request_counts = OrderedDict()
+
+# Algorand client setup. The token is read once per worker at import; a
+# missing or unreadable file falls back to the empty token, but only I/O
+# errors are swallowed so logic bugs cannot hide here
 ALGOD_TOKEN = ""
 try:
     with open("/algod/data/algod.token", "r") as f:
         ALGOD_TOKEN = f.read().strip()
-except:
-    # Fall back to empty token if file not found
-    pass
+except OSError as e:
+    app.logger.warning("algod token unavailable, using empty token: %s", e)
 
 ALGOD_ADDRESS = "http://localhost:8080"
-algod_client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """AlgodClient that issues its requests over a pooled keep-alive session.
+
+    The stock client opens a fresh urllib connection per call, paying TCP
+    setup and teardown on every suggested_params/status/pending poll. Routing
+    through one requests.Session keeps connections alive across calls while
+    preserving the stock auth, versioning and error semantics.
+    """
+
+    def __init__(self, algod_token, algod_address, headers=None):
+        super().__init__(algod_token, algod_address, headers)
+        self.session = requests.Session()
+        # Retry transient failures on GETs only; POSTs (send_transaction)
+        # must never be replayed by the transport
+        retries = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def algod_request(
+        self,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        response_format="json",
+        timeout=30,
+    ):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+
+        resp = self.session.request(
+            method,
+            self.algod_address + requrl,
+            params=params,
+            data=data,
+            headers=header,
+            timeout=timeout,
+        )
+
+        if resp.status_code >= 400:
+            j = {}
+            try:
+                j = resp.json()
+                message = j["message"]
+            except Exception:
+                message = resp.text
+            raise error.AlgodHTTPError(message, resp.status_code, j.get("data"))
+
+        if response_format == "json":
+            # Some algod responses return 200 OK with an empty body
+            if not resp.content:
+                return {}
+            try:
+                return resp.json()
+            except Exception as e:
+                raise error.AlgodResponseError(
+                    "Failed to parse JSON response from algod"
+                ) from e
+        return resp.content
+
+    @staticmethod
+    def _canonical_msgpack(txn):
+        """Canonical msgpack bytes for a signed transaction, no base64 detour."""
+        return encoding.msgpack.packb(
+            encoding._sort_dict(txn.dictify()), use_bin_type=True
+        )
+
+    def send_transaction(self, txn, **kwargs):
+        """Broadcast one signed transaction; returns its transaction id."""
+        return self.send_transactions([txn], **kwargs)
+
+    def send_transactions(self, txns, **kwargs):
+        """Broadcast signed transactions as raw msgpack in one POST.
+
+        algod validates a multi-transaction body as one atomic group, so
+        callers must assign_group_id before signing when passing more than
+        one transaction (matching the stock SDK's semantics). The stock SDK
+        path base64-encodes the msgpack only to decode it again just before
+        the request; posting the bytes straight through drops two base64
+        passes per submission.
+        """
+        data = b"".join(self._canonical_msgpack(txn) for txn in txns)
+        headers = {"Content-Type": "application/x-binary"}
+        resp = self.algod_request(
+            "POST", "/transactions", data=data, headers=headers, **kwargs
+        )
+        return resp["txId"]
+
+
+algod_client = PooledAlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+
+# Suggested transaction params change only per round (~4s), so a 1s TTL cache
+# drops one algod round-trip from every transfer while last_valid stays good
+# for ~1000 rounds
+_PARAMS_TTL = 1.0
+_params_cache = {"ts": 0.0, "val": None}
+
+
+def cached_suggested_params():
+    """Return suggested params, refreshing from algod at most once per second."""
+    now = time.monotonic()
+    if _params_cache["val"] is None or now - _params_cache["ts"] > _PARAMS_TTL:
+        _params_cache["val"] = algod_client.suggested_params()
+        _params_cache["ts"] = now
+    return _params_cache["val"]
+
+
+@app.before_request
+def resolve_client_ip():
+    """Resolve the real client IP once per request.
+
+    Behind Fly's proxy request.remote_addr is the proxy, which would collapse
+    every client into one rate-limit bucket. Fly stamps the real address into
+    Fly-Client-IP; failing that, only the last X-Forwarded-For hop can be
+    trusted (the proxy appends it), since earlier entries are client-supplied
+    and would let a caller mint a fresh rate-limit bucket per request.
+    Reading it once here also skips Werkzeug's descriptor chain in each
+    endpoint.
+    """
+    client_ip = request.environ.get("HTTP_FLY_CLIENT_IP")
+    if not client_ip:
+        xff = request.environ.get("HTTP_X_FORWARDED_FOR")
+        client_ip = xff.rsplit(",", 1)[-1].strip() if xff else request.remote_addr
+    g.client_ip = client_ip
 
 
 def rate_limit(client_ip):
-    """Basic rate limiting to prevent abuse."""
-    current_time = int(time.time())
-
-    # Clean up old entries
-    for ip in list(request_counts.keys()):
-        if current_time - request_counts[ip]["timestamp"] > RATE_WINDOW:
-            del request_counts[ip]
-
-    # Check/update the count for this IP
-    if client_ip in request_counts:
-        if current_time - request_counts[client_ip]["timestamp"] > RATE_WINDOW:
-            # Reset if window has passed
-            request_counts[client_ip] = {"count": 1, "timestamp": current_time}
-        else:
-            # Increment count
-            request_counts[client_ip]["count"] += 1
+    """Basic rate limiting to prevent abuse (token bucket, refilled lazily)."""
+    now = time.monotonic()
+
+    bucket = request_counts.get(client_ip)
+    if bucket is None:
+        tokens = float(BUCKET_CAPACITY)
     else:
-        # First request from this IP
-        request_counts[client_ip] = {"count": 1, "timestamp": current_time}
+        tokens, last_refill = bucket
+        tokens = min(BUCKET_CAPACITY, tokens + (now - last_refill) * REFILL_RATE)
+        request_counts.move_to_end(client_ip)
+
+    allowed = tokens >= 1
+    request_counts[client_ip] = (tokens - 1, now) if allowed else (tokens, now)
 
-    # Return True if rate limit exceeded
-    return request_counts[client_ip]["count"] > REQUEST_LIMIT
+    if len(request_counts) > MAX_TRACKED_IPS:
+        request_counts.popitem(last=False)
 
+    return not allowed
 
-from algosdk import mnemonic, account
+
+# Memoized mnemonic -> (private_key, address) derivations. The 25-word
+# decoding plus ed25519 key derivation runs on every /balance and /transfer
+# call, so repeat callers hit this cache instead. Keys are sha256 digests of
+# the phrase so plaintext mnemonics are not retained as cache keys, and the
+# LRU bound keeps memory constant
+_DERIVE_CACHE_SIZE = 1024
+_derive_cache = OrderedDict()
+
+
+def _derive_key(mnemonic_phrase):
+    """Return (private_key, address) for a mnemonic, memoized by phrase hash."""
+    cache_key = hashlib.sha256(mnemonic_phrase.encode()).digest()
+    hit = _derive_cache.get(cache_key)
+    if hit is not None:
+        _derive_cache.move_to_end(cache_key)
+        return hit
+
+    private_key = mnemonic.to_private_key(mnemonic_phrase)
+    address = account.address_from_private_key(private_key)
+    _derive_cache[cache_key] = (private_key, address)
+    if len(_derive_cache) > _DERIVE_CACHE_SIZE:
+        _derive_cache.popitem(last=False)
+    return private_key, address
 
 
 def validate_mnemonic(mnemonic_phrase, address=None):
-    """Validate that the mnemonic is valid and corresponds to the address if provided."""
+    """Validate the mnemonic (and its address, if provided).
+
+    Returns (ok, private_key) so callers that go on to sign can reuse the
+    already-derived key instead of decoding the mnemonic a second time.
+    """
     try:
-        # Try to convert mnemonic to private key (will raise if invalid)
-        private_key = mnemonic.to_private_key(mnemonic_phrase)
+        # Convert mnemonic to private key (will raise if invalid)
+        private_key, derived_address = _derive_key(mnemonic_phrase)
 
-        # If address is provided, check if mnemonic resolves to it
+        # If address is provided, check if mnemonic resolves to it; use a
+        # constant-time comparison so timing leaks nothing about the match
         if address:
-            derived_address = account.address_from_private_key(private_key)
-            if derived_address != address:
-                print(f"Invalid mnemonic for address: {derived_address} != {address}")
-            return derived_address == address
+            if not hmac.compare_digest(derived_address, address):
+                app.logger.debug("Mnemonic does not match the supplied address")
+                return False, None
+
+        return True, private_key
+    except Exception:
+        app.logger.debug("Mnemonic validation failed")
+        return False, None
 
-        return True
-    except Exception as e:
-        print(f"Error validating mnemonic: {e}")
-        return False
 
+# Pre-generated account pool: ed25519 keygen is the one CPU-bound step in
+# this file, so a background thread keeps the queue topped up and
+# /api/account/new usually returns in queue-pop time. Keypairs are
+# independent, so generating them ahead of the request is safe
+_ACCOUNT_POOL_SIZE = 256
+_account_pool = queue.Queue(maxsize=_ACCOUNT_POOL_SIZE)
 
-@app.route("/static/<path:path>")
-def send_static(path):
-    """Serve static files"""
-    static_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
-    return send_from_directory(static_folder, path)
+
+def _fill_account_pool():
+    """Keep the account pool full; put() blocks while the pool is topped up."""
+    while True:
+        private_key, address = account.generate_account()
+        _account_pool.put((address, mnemonic.from_private_key(private_key)))
+
+
+threading.Thread(target=_fill_account_pool, daemon=True).start()
+
+
+# Swagger UI fetches the spec on every page load; it is pre-gzipped at
+# deploy time, so serving is a sendfile of the compressed bytes plus a
+# day of client-side caching
+_OPENAPI_MAX_AGE = 86400
+
+
+@app.route("/static/openapi.json")
+def openapi_json():
+    """Serve the OpenAPI spec pre-compressed with long-lived cache headers."""
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = send_from_directory(
+            app.static_folder,
+            "openapi.json.gz",
+            mimetype="application/json",
+            max_age=_OPENAPI_MAX_AGE,
+        )
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = send_from_directory(
+            app.static_folder, "openapi.json", max_age=_OPENAPI_MAX_AGE
+        )
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 
 @app.route("/api/account/new", methods=["POST"])
 def create_account():
     """Create a new Algorand account."""
     # Basic rate limiting
-    client_ip = request.remote_addr
-    if rate_limit(client_ip):
+    if rate_limit(g.client_ip):
         return jsonify({"error": "Rate limit exceeded"}), 429
 
     try:
-        # Generate a new account
-        private_key, address = account.generate_account()
-        mnemo = mnemonic.from_private_key(private_key)
+        # Pop a pre-generated keypair, generating inline only when a burst
+        # has drained the pool faster than the filler thread refills it
+        try:
+            address, mnemo = _account_pool.get_nowait()
+        except queue.Empty:
+            private_key, address = account.generate_account()
+            mnemo = mnemonic.from_private_key(private_key)
 
         return jsonify({"address": address, "mnemonic": mnemo})
     except Exception as e:
@@ -504,8 +362,7 @@ def create_account():
 def get_balance():
     """Get the balance of an account with mnemonic authentication."""
     # Basic rate limiting
-    client_ip = request.remote_addr
-    if rate_limit(client_ip):
+    if rate_limit(g.client_ip):
         return jsonify({"error": "Rate limit exceeded"}), 429
 
     try:
@@ -518,7 +375,8 @@ def get_balance():
             return jsonify({"error": "Missing address or mnemonic"}), 400
 
         # Validate mnemonic corresponds to address
-        if not validate_mnemonic(mnemo, address):
+        valid, _ = validate_mnemonic(mnemo, address)
+        if not valid:
             return jsonify({"error": "Invalid mnemonic for address"}), 403
 
         # Get account info
@@ -542,46 +400,48 @@ def get_balance():
 def transfer_funds():
     """Transfer funds from one account to another with mnemonic authentication."""
     # Basic rate limiting
-    client_ip = request.remote_addr
-    if rate_limit(client_ip):
+    if rate_limit(g.client_ip):
         return jsonify({"error": "Rate limit exceeded"}), 429
 
     try:
         data = request.get_json()
-        sender_address = data.get("from")
-        sender_mnemonic = data.get("mnemonic")
-        receiver_address = data.get("to")
-        amount = data.get("amount")
+
+        # Validate inputs in one unpack instead of four .get() calls plus a
+        # string-conversion try/except; a missing field or non-dict body
+        # lands in the single handler below
+        try:
+            sender_address = data["from"]
+            sender_mnemonic = data["mnemonic"]
+            receiver_address = data["to"]
+            amount = data["amount"]
+        except (KeyError, TypeError):
+            return jsonify({"error": "Missing required fields"}), 400
         note = data.get("note", "")
 
-        # Validate inputs
-        if not all([sender_address, sender_mnemonic, receiver_address, amount]):
+        if not (sender_address and sender_mnemonic and receiver_address):
             return jsonify({"error": "Missing required fields"}), 400
 
-        try:
-            amount = int(amount)
-            if amount <= 0:
-                raise ValueError("Amount must be positive")
-        except ValueError:
+        # Amount must arrive as a JSON integer; no string coercion
+        if type(amount) is not int or amount <= 0:
             return jsonify({"error": "Invalid amount"}), 400
 
-        # Validate mnemonic corresponds to sender address
-        if not validate_mnemonic(sender_mnemonic, sender_address):
+        # Validate mnemonic corresponds to sender address; the validator hands
+        # back the private key so it is never derived twice
+        valid, sender_private_key = validate_mnemonic(sender_mnemonic, sender_address)
+        if not valid:
             return jsonify({"error": "Invalid mnemonic for sender address"}), 403
 
-        # Convert mnemonic to private key
-        sender_private_key = mnemonic.to_private_key(sender_mnemonic)
-
-        # Get transaction parameters
-        params = algod_client.suggested_params()
+        # Get transaction parameters (cached for up to a second)
+        params = cached_suggested_params()
 
         # Create and sign transaction
+        note_bytes = note.encode() if note else None
         unsigned_txn = PaymentTxn(
             sender=sender_address,
             sp=params,
             receiver=receiver_address,
             amt=amount,
-            note=note.encode() if note else None,
+            note=note_bytes,
         )
 
         signed_txn = unsigned_txn.sign(sender_private_key)
@@ -589,12 +449,33 @@ def transfer_funds():
         # Submit transaction
         tx_id = algod_client.send_transaction(signed_txn)
 
-        # Wait for confirmation
-        try:
-            wait_for_confirmation(algod_client, tx_id)
-            return jsonify({"tx_id": tx_id, "status": "confirmed"})
-        except Exception as e:
-            return jsonify({"tx_id": tx_id, "status": "pending", "error": str(e)}), 202
+        # Opt-in synchronous wait for clients that want one round trip;
+        # under gevent the blocked greenlet yields the worker meanwhile
+        if data.get("wait") is True:
+            try:
+                wait_for_confirmation(algod_client, tx_id)
+                return jsonify({"tx_id": tx_id, "status": "confirmed"})
+            except Exception as e:
+                return (
+                    jsonify(
+                        {
+                            "tx_id": tx_id,
+                            "status": "pending",
+                            "error": str(e),
+                            "poll": f"/api/tx/{tx_id}",
+                        }
+                    ),
+                    202,
+                )
+
+        # Default: hand confirmation to the shared watcher and answer
+        # immediately, since holding the worker for block time (~4s) capped
+        # throughput at one transfer per worker per round
+        _register_confirmation(tx_id)
+        return (
+            jsonify({"tx_id": tx_id, "status": "pending", "poll": f"/api/tx/{tx_id}"}),
+            202,
+        )
 
     except Exception as e:
         stacktrace = traceback.format_exc()
@@ -602,26 +483,311 @@ def transfer_funds():
         return jsonify({"error": f"Failed to transfer funds: {str(e)}"}), 500
 
 
+# One rate-limit token covers the whole batch; the cap keeps a single
+# request from monopolizing a worker with signing work
+_MAX_BATCH_TRANSFERS = 16
+
+
+@app.route("/api/transfer/batch", methods=["POST"])
+def transfer_funds_batch():
+    """Submit several independent transfers with one API request.
+
+    All transactions share one suggested_params fetch and are signed up
+    front, then each is submitted in its own POST over the pooled
+    keep-alive session -- algod treats a multi-transaction body as one
+    atomic group, which these deliberately are not. Results come back in
+    entry order; a failed submission carries an error in its slot while
+    the rest of the batch proceeds. Confirmations are handed to the
+    shared watcher just like single transfers.
+    """
+    # Basic rate limiting
+    if rate_limit(g.client_ip):
+        return jsonify({"error": "Rate limit exceeded"}), 429
+
+    try:
+        transfers = request.get_json()
+        if not isinstance(transfers, list) or not transfers:
+            return jsonify({"error": "Expected a non-empty list of transfers"}), 400
+        if len(transfers) > _MAX_BATCH_TRANSFERS:
+            return (
+                jsonify(
+                    {"error": f"At most {_MAX_BATCH_TRANSFERS} transfers per batch"}
+                ),
+                400,
+            )
+
+        # Validate every entry before touching algod, so a malformed batch
+        # costs no round-trip and still gets its 400 when the node is down
+        validated = []
+        for entry in transfers:
+            try:
+                sender_address = entry["from"]
+                sender_mnemonic = entry["mnemonic"]
+                receiver_address = entry["to"]
+                amount = entry["amount"]
+            except (KeyError, TypeError):
+                return jsonify({"error": "Missing required fields"}), 400
+            note = entry.get("note", "")
+
+            if not (sender_address and sender_mnemonic and receiver_address):
+                return jsonify({"error": "Missing required fields"}), 400
+
+            if type(amount) is not int or amount <= 0:
+                return jsonify({"error": "Invalid amount"}), 400
+
+            valid, sender_private_key = validate_mnemonic(
+                sender_mnemonic, sender_address
+            )
+            if not valid:
+                return jsonify({"error": "Invalid mnemonic for sender address"}), 403
+
+            note_bytes = note.encode() if note else None
+            validated.append(
+                (sender_address, receiver_address, amount, note_bytes, sender_private_key)
+            )
+
+        # Sign everything against one params fetch, so a signing failure
+        # rejects the whole batch before anything reaches the network
+        params = cached_suggested_params()
+        signed_txns = [
+            PaymentTxn(
+                sender=sender_address,
+                sp=params,
+                receiver=receiver_address,
+                amt=amount,
+                note=note_bytes,
+            ).sign(sender_private_key)
+            for sender_address, receiver_address, amount, note_bytes, sender_private_key in validated
+        ]
+
+        # One POST per transaction: a combined body would be validated as an
+        # atomic group and rejected for its empty Group fields. The pooled
+        # session keeps the extra round-trips on one warm connection.
+        # Submissions already on the network cannot be unwound, so a failed
+        # POST is reported in its slot instead of failing the whole batch
+        # and discarding the earlier tx_ids -- same in-order contract as the
+        # client-side AlgorandBatch
+        results = []
+        for signed_txn in signed_txns:
+            try:
+                tx_id = algod_client.send_transaction(signed_txn)
+            except Exception as e:
+                results.append({"status": "failed", "error": str(e)})
+                continue
+            _register_confirmation(tx_id)
+            results.append({"tx_id": tx_id, "status": "pending"})
+        return jsonify(results), 202
+
+    except Exception as e:
+        stacktrace = traceback.format_exc()
+        app.logger.error(f"Error transferring funds in batch: {e}\n{stacktrace}")
+        return jsonify({"error": f"Failed to transfer funds: {str(e)}"}), 500
+
+
+@app.route("/api/tx/<tx_id>", methods=["GET"])
+def transaction_status(tx_id):
+    """Poll the confirmation status of a transaction submitted via /api/transfer."""
+    if rate_limit(g.client_ip):
+        return jsonify({"error": "Rate limit exceeded"}), 429
+
+    result = _confirm_results.get(tx_id)
+    if isinstance(result, Exception):
+        return jsonify({"tx_id": tx_id, "status": "failed", "error": str(result)})
+    if result:
+        return jsonify(
+            {
+                "tx_id": tx_id,
+                "status": "confirmed",
+                "confirmed_round": result.get("confirmed-round"),
+            }
+        )
+
+    with _confirm_lock:
+        if tx_id in _confirm_waiters:
+            return jsonify({"tx_id": tx_id, "status": "pending"}), 202
+
+    # Unknown here (submitted through another worker, or its result was
+    # evicted): ask algod directly
+    try:
+        pending_txn = algod_client.pending_transaction_info(tx_id)
+    except Exception:
+        return jsonify({"error": "Transaction not found"}), 404
+
+    if pending_txn.get("confirmed-round", 0) > 0:
+        return jsonify(
+            {
+                "tx_id": tx_id,
+                "status": "confirmed",
+                "confirmed_round": pending_txn["confirmed-round"],
+            }
+        )
+    if pending_txn.get("pool-error"):
+        return jsonify(
+            {"tx_id": tx_id, "status": "failed", "error": pending_txn["pool-error"]}
+        )
+    return jsonify({"tx_id": tx_id, "status": "pending"}), 202
+
+
+# Shared confirmation watcher: concurrent transfers used to each run their
+# own polling loop, multiplying algod traffic by the number of in-flight
+# transactions. A single daemon thread long-polls one status_after_block per
+# round and sweeps every outstanding txid, waking waiters through per-txid
+# events
+_confirm_lock = threading.Lock()
+_confirm_waiters = {}  # txid -> threading.Event
+_confirm_results = OrderedDict()  # txid -> pending info dict, Exception, or None
+_confirm_thread = None
+
+# Results wait here until a client polls them; bound the map so transfers
+# whose callers never poll cannot grow it without limit
+_CONFIRM_RESULTS_MAX = 1024
+
+# Distinguishes "no outcome recorded" from a resolved-to-None outcome when a
+# waiter is woken by a dying watcher thread
+_NO_RESULT = object()
+
+# Algorand produces a block roughly every 4 seconds
+_SECONDS_PER_ROUND = 4
+
+
+def _resolve_confirmation(txid, result):
+    """Record a watcher outcome for txid and wake its waiter."""
+    with _confirm_lock:
+        event = _confirm_waiters.pop(txid, None)
+        _confirm_results[txid] = result
+        while len(_confirm_results) > _CONFIRM_RESULTS_MAX:
+            _confirm_results.popitem(last=False)
+    if event is not None:
+        event.set()
+
+
+def _register_confirmation(txid):
+    """Register txid with the watcher thread, starting it if needed."""
+    global _confirm_thread
+    event = threading.Event()
+    with _confirm_lock:
+        _confirm_waiters[txid] = event
+        if _confirm_thread is None:
+            _confirm_thread = threading.Thread(
+                target=_confirmation_watcher, daemon=True
+            )
+            _confirm_thread.start()
+    return event
+
+
+def _confirmation_watcher():
+    """Sweep all outstanding confirmations with one long-poll per round.
+
+    algod hiccups (restarts, timeouts past the transport retries) must not
+    kill the thread: the round calls are wrapped so a failure just pauses
+    the sweep, and the finally block guarantees that however the thread
+    exits, outstanding waiters are woken and the next registration starts
+    a fresh thread.
+    """
+    global _confirm_thread
+    current_round = None
+    try:
+        while True:
+            with _confirm_lock:
+                if not _confirm_waiters:
+                    return
+                txids = list(_confirm_waiters)
+
+            try:
+                if current_round is None:
+                    current_round = algod_client.status()["last-round"]
+
+                for txid in txids:
+                    try:
+                        pending_txn = algod_client.pending_transaction_info(txid)
+                    except Exception:
+                        _resolve_confirmation(txid, None)
+                        continue
+
+                    if pending_txn.get("confirmed-round", 0) > 0:
+                        _resolve_confirmation(txid, pending_txn)
+                    elif pending_txn.get("pool-error"):
+                        _resolve_confirmation(
+                            txid,
+                            Exception(
+                                f"Transaction failed: {pending_txn['pool-error']}"
+                            ),
+                        )
+
+                status = algod_client.status_after_block(current_round)
+                current_round = max(current_round + 1, status.get("last-round", 0))
+            except Exception:
+                # algod unreachable: keep sweeping, re-learn the round once
+                # it is back
+                current_round = None
+                time.sleep(1)
+    finally:
+        # Reached on the empty-set return and on any unexpected failure.
+        # Drop the thread handle so the next registration restarts the
+        # watcher, and wake leftover waiters resultless -- they surface a
+        # watcher-interrupted error rather than hanging forever
+        with _confirm_lock:
+            _confirm_thread = None
+            leftovers = list(_confirm_waiters.values())
+            _confirm_waiters.clear()
+        for event in leftovers:
+            event.set()
+
+
 def wait_for_confirmation(client, txid, timeout=10):
-    """Wait until the transaction is confirmed or rejected, or until timeout."""
-    start_round = client.status()["last-round"] + 1
-    current_round = start_round
+    """Wait until the transaction is confirmed or rejected, or until timeout.
 
-    while current_round < start_round + timeout:
-        try:
-            pending_txn = client.pending_transaction_info(txid)
-        except Exception:
-            return
+    The pending pool is checked before anything else, so a transaction that
+    confirmed during submission returns with a single round-trip; otherwise
+    the txid is handed to the shared watcher thread and this call just waits
+    on its event. timeout is in rounds, matching the old polling loop.
+    """
+    try:
+        pending_txn = client.pending_transaction_info(txid)
+    except Exception:
+        return
 
-        if pending_txn.get("confirmed-round", 0) > 0:
-            return pending_txn
-        elif pending_txn.get("pool-error"):
-            raise Exception(f"Transaction failed: {pending_txn['pool-error']}")
+    if pending_txn.get("confirmed-round", 0) > 0:
+        return pending_txn
+    elif pending_txn.get("pool-error"):
+        raise Exception(f"Transaction failed: {pending_txn['pool-error']}")
 
-        client.status_after_block(current_round)
-        current_round += 1
+    event = _register_confirmation(txid)
+    if not event.wait(timeout * _SECONDS_PER_ROUND):
+        with _confirm_lock:
+            _confirm_waiters.pop(txid, None)
+        _confirm_results.pop(txid, None)
+        raise Exception(f"Transaction not confirmed after {timeout} rounds")
 
-    raise Exception(f"Transaction not confirmed after {timeout} rounds")
+    result = _confirm_results.pop(txid, _NO_RESULT)
+    if result is _NO_RESULT:
+        # Woken by a dying watcher rather than a real outcome
+        raise Exception("Transaction not confirmed: confirmation watcher interrupted")
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+# Health probes can arrive at 1Hz or faster per replica; caching the node
+# status for half a second keeps them from pressuring algod (and from timing
+# out in a herd when algod is momentarily slow)
+_STATUS_TTL = 0.5
+_status_cache = {"ts": 0.0, "val": None}
+
+
+def _cached_node_status():
+    """Return algod status, refreshing at most twice per second."""
+    now = time.monotonic()
+    if _status_cache["val"] is None or now - _status_cache["ts"] > _STATUS_TTL:
+        _status_cache["val"] = algod_client.status()
+        _status_cache["ts"] = now
+    return _status_cache["val"]
+
+
+@app.route("/healthz", methods=["GET"])
+def liveness_check():
+    """Liveness probe: the process is up, no algod round-trip involved."""
+    return jsonify({"status": "alive"})
 
 
 @app.route("/health", methods=["GET"])
@@ -629,7 +795,7 @@ def health_check():
     """Health check endpoint for the API."""
     try:
         # Check if we can connect to the Algorand node
-        status = algod_client.status()
+        status = _cached_node_status()
         return jsonify(
             {
                 "status": "healthy",
@@ -643,10 +809,6 @@ def health_check():
         return jsonify({"status": "unhealthy", "error": str(e)}), 503
 
 
-# Log when API is initialized
-app.logger.info("Algorand minimal REST API initialized")
-print("Starting Algorand minimal REST API server on port 3000...")
-
 if __name__ == "__main__":
     # Run the API server on all interfaces, port 3000
     app.run(host="0.0.0.0", port=3000)
@@ -14,6 +14,7 @@ source venv/bin/activate
 pip install algosdk requests
 
 python3 local/create-genesis-json.py "$1" "$2"
+python3 local/create-openapi-json.py
 
 echo "Setup complete! Genesis file created in the 'generated' directory."
 